@@ -1,13 +1,22 @@
 import asyncio
 import logging
 from asyncio import open_connection
+from contextlib import suppress
 from logging import getLogger
 from socket import socket
-from uuid import uuid4
+from typing import Self
 
-from smart_rpc.constants import MESSAGE_SEPARATOR
-from smart_rpc.errors import ClientFatalError
-from smart_rpc.messages import Request, Response
+from smart_rpc.constants import FAILURE_MARK, MESSAGE_SEPARATOR
+from smart_rpc.errors import (
+    ClientFatalError,
+    RequestTimeoutError,
+    ValidationError,
+)
+from smart_rpc.messages import (
+    ErrorResponse,
+    Request,
+    Response,
+)
 
 
 class BaseClient:
@@ -17,7 +26,12 @@ class BaseClient:
     max_message_size: int
     timeout_ms: int
 
-    locking_event: asyncio.Event
+    write_buffer: list[bytes]
+    flush_task: asyncio.Task[None] | None
+    pending: dict[str, asyncio.Future[Response]]
+    reader_task: asyncio.Task[None]
+    connection_error: BaseException | None
+    loop: asyncio.AbstractEventLoop
 
     writer: asyncio.StreamWriter
     reader: asyncio.StreamReader
@@ -27,7 +41,7 @@ class BaseClient:
         self,
         host: str,
         port: int,
-        max_message_size: int = 20,  # 1 MB
+        max_message_size: int = 2**20,  # 1 MB
         timeout_ms: int = 5000,  # 5 second
     ) -> None:
         self.host = host
@@ -35,7 +49,10 @@ class BaseClient:
         self.max_message_size = max_message_size
         self.timeout_ms = timeout_ms
 
-        self.locking_event = asyncio.Event()
+        self.write_buffer = []
+        self.flush_task = None
+        self.pending = {}
+        self.connection_error = None
         self.logger = getLogger(self.__class__.__name__)
 
     async def connect(self) -> None:
@@ -43,23 +60,117 @@ class BaseClient:
             self.reader, self.writer = await open_connection(
                 host=self.host,
                 port=self.port,
+                limit=self.max_message_size,
             )
         except ConnectionRefusedError as error:
             raise ClientFatalError.from_base_exception(error) from error
 
-    async def send(self, request: Request) -> Response:
-        request.trace_id = str(uuid4())
+        self.loop = asyncio.get_running_loop()
+        self.reader_task = self.loop.create_task(self._read_responses())
+
+    async def close(self) -> None:
+        self.reader_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.reader_task
+
+        if not self.connection_error:
+            self._close(ConnectionAbortedError('Client was closed'))
+
+        with suppress(ConnectionError):
+            await self.writer.wait_closed()
+
+    async def __aenter__(self) -> Self:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    def _fail_pending(self, error: BaseException) -> None:
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ClientFatalError.from_base_exception(error))
+
+        self.pending.clear()
+
+    def _close(self, error: BaseException) -> None:
+        self.connection_error = error
+        self.writer.close()
+
+        self._fail_pending(error)
+
+    @staticmethod
+    def _load_response(data: bytes) -> Response:
+        if data.startswith(FAILURE_MARK, data.find(b':')):
+            with suppress(ValidationError):
+                return ErrorResponse.load(data)
+
+        return Response.load(data)
+
+    async def _read_responses(self) -> None:
+        while True:
+            try:
+                data = await self.reader.readuntil(MESSAGE_SEPARATOR)
+            except (
+                ConnectionError,
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+            ) as error:
+                self._close(error)
+                return
+
+            try:
+                response = self._load_response(data[:-1])
+            except ValidationError as error:
+                self.logger.warning(error)
+                continue
 
-        await self.locking_event.wait()
-        self.locking_event.set()
+            future = self.pending.pop(response.trace_id, None)
+            if not future or future.done():
+                self.logger.warning(f'Response with unknown trace_id: {response}')
+                continue
 
-        self.writer.write(request.dump() + MESSAGE_SEPARATOR)
+            future.set_result(response)
+
+    async def _flush(self) -> None:
+        write_buffer, self.write_buffer = self.write_buffer, []
+        self.flush_task = None
+
+        if self.writer.is_closing():
+            return
+
+        self.writer.writelines(write_buffer)
         await self.writer.drain()
-        data = await self.reader.readuntil(MESSAGE_SEPARATOR)
 
-        self.locking_event.clear()
+    async def send(self, request: Request) -> Response:
+        if self.connection_error:
+            raise ClientFatalError.from_base_exception(self.connection_error)
+
+        if request.trace_id in self.pending:
+            raise ValidationError(
+                details={'trace_id': f'request {request.trace_id} is already awaiting a response'},
+            )
+
+        future = self.loop.create_future()
+        self.pending[request.trace_id] = future
 
-        return Response.load(data[:-1])
+        self.write_buffer.append(request.dump())
+        self.write_buffer.append(MESSAGE_SEPARATOR)
+
+        if not self.flush_task:
+            self.flush_task = self.loop.create_task(self._flush())
+
+        flush_task = self.flush_task
+
+        try:
+            await asyncio.shield(flush_task)
+            return await asyncio.wait_for(future, timeout=self.timeout_ms / 1000)
+        except TimeoutError as error:
+            raise RequestTimeoutError(timeout=self.timeout_ms) from error
+        except ConnectionError as error:
+            raise ClientFatalError.from_base_exception(error) from error
+        finally:
+            self.pending.pop(request.trace_id, None)
 
 
 if __name__ == '__main__':
@@ -90,11 +201,10 @@ if __name__ == '__main__':
     )
 
     async def main() -> None:
-        await client.connect()
-
-        response = await client.first_method(
-            send_this='back',
-        )
-        print(response)
+        async with client:
+            response = await client.first_method(
+                send_this='back',
+            )
+            print(response)
 
     asyncio.run(main())
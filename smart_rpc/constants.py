@@ -3,3 +3,7 @@ from uuid import UUID
 MESSAGE_SEPARATOR = b'\x1a'
 ZERO_TRACE_ID = str(UUID(int=0))
 CLIENT_HEARTBEAT_MESSAGE = b'heartbeat'
+SUCCESS_MARK = b':ok'
+FAILURE_MARK = b':err'
+TRACE_ID_POOL_SIZE = 2**10  # 1024 ids per os.urandom call
+ERROR_RESPONSE_CACHE_SIZE = 64
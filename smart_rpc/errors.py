@@ -7,6 +7,7 @@ class BaseError(Exception):
     error_code: str
     details: dict[str, Any]
     log_level: int
+    _str: str | None
 
     def __init__(
         self,
@@ -17,17 +18,18 @@ class BaseError(Exception):
     ) -> None:
         self.error_code = error_code
         self.log_level = log_level
-        self.details = {
-            'error_code': self.error_code,
-            'details': details or {},
-        }
+        self.details = details or {}
+        self._str = None
 
     @property
     def is_fatal(self) -> bool:
         return self.log_level == logging.CRITICAL
 
     def __str__(self) -> str:
-        return f'{self.error_code}: {self.details}'
+        if self._str is None:
+            self._str = f'{self.error_code}: {self.details}'
+
+        return self._str
 
     @classmethod
     def from_base_exception(
@@ -98,6 +100,13 @@ class ExternalError(BaseError):
     ...
 
 
+ERROR_LOG_LEVELS = frozenset((
+    logging.CRITICAL,
+    logging.ERROR,
+    logging.WARNING,
+))
+
+
 def handle_error(
     logger: logging.Logger,
     error: BaseError,
@@ -105,7 +114,7 @@ def handle_error(
     *,
     exit_if_fatal: bool = False,
 ) -> None:
-    if exit_if_fatal and error.is_fatal:
+    if error.is_fatal and exit_if_fatal:
         logger.error(error)
         logger.error('Exiting')
         sys.exit(1)
@@ -113,15 +122,7 @@ def handle_error(
     if log_level > error.log_level:
         return
 
-    match error.log_level:
-        case logging.CRITICAL:
-            logger.critical(error)
-        case logging.ERROR:
-            logger.error(error)
-        case logging.WARNING:
-            logger.warning(error)
-        case _:
-            logger.warning(error)
+    logger.log(error.log_level if error.log_level in ERROR_LOG_LEVELS else logging.WARNING, error)
 
 
 class ValidationError(ExternalError):
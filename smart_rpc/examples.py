@@ -20,17 +20,25 @@ class SomeObjectSchema(BaseSchema):
     bool_field: bool
 
 
+class ExampleRequestPayloadSchema(BasePayloadSchema):
+    send_this: str
+    object_field: SomeObjectSchema
+
+
+class ExampleResponsePayloadSchema(BasePayloadSchema):
+    some_param: str
+    send_this: str
+    object_field: SomeObjectSchema
+
+
 class ExampleRequest(Request):
-    class PayloadSchema(BasePayloadSchema):
-        send_this: str
-        object_field: SomeObjectSchema
+    PayloadSchema = ExampleRequestPayloadSchema  # type:ignore[assignment]
+    payload: ExampleRequestPayloadSchema
 
 
 class ExampleResponse(Response):
-    class PayloadSchema(BasePayloadSchema):
-        some_param: str
-        send_this: str
-        object_field: SomeObjectSchema
+    PayloadSchema = ExampleResponsePayloadSchema  # type:ignore[assignment]
+    payload: ExampleResponsePayloadSchema
 
 
 example_request_values = {
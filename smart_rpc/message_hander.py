@@ -1,7 +1,13 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Mapping,
+)
+from types import MappingProxyType
 from typing import Self
 
 from smart_rpc.errors import (
+    ExternalError,
     MethodInternalError,
     UnknownMethodError,
     ValidationError,
@@ -14,26 +20,34 @@ from smart_rpc.messages import (
 )
 
 type HandlerMethod = Callable[[Request, UserIface], Awaitable[Response]]
+type HandlerRoute = tuple[HandlerMethod, type[Request] | None]
 
 
 class MessageHandler:
-    methods: dict[str, HandlerMethod]
+    routes: dict[str, HandlerRoute]
 
     def __init__(self) -> None:
-        self.methods = {}
+        self.routes = {}
+
+    @property
+    def methods(self) -> Mapping[str, HandlerMethod]:
+        return MappingProxyType({
+            method_name: method
+            for method_name, (method, _) in self.routes.items()
+        })
 
     def include(
         self,
         message_handler: Self,
     ) -> None:
-        self.methods.update(message_handler.methods)
+        self.routes.update(message_handler.routes)
 
     def add_method(
         self,
         method_name: str,
         func: HandlerMethod,
     ) -> None:
-        self.methods[method_name] = func
+        self.routes[method_name] = (func, func.__annotations__.get('request'))
 
     def method(
         self,
@@ -48,9 +62,21 @@ class MessageHandler:
             return func
         return decorator
 
+    @staticmethod
+    def _response_from_error(
+        error: ExternalError,
+        message: bytes | bytearray,
+    ) -> Response:
+        try:
+            request = Request.load(message)
+        except ValidationError:
+            return response_from_error(error)
+
+        return response_from_error(error, request)
+
     async def handle(
         self,
-        message: bytes,
+        message: bytes | bytearray,
         user: UserIface,
     ) -> Response:
         try:
@@ -58,26 +84,28 @@ class MessageHandler:
         except ValidationError as error:
             return response_from_error(error)
 
-        method = self.methods.get(method_name)
-        if not method or method_name not in self.methods:
-            return response_from_error(UnknownMethodError(method_name))
+        route = self.routes.get(method_name)
+        if not route:
+            return self._response_from_error(UnknownMethodError(method_name), message)
 
-        request_class = self.methods[method_name].__annotations__.get('request')
+        method, request_class = route
         if not request_class:
-            return response_from_error(
+            return self._response_from_error(
                 MethodInternalError(
                     details={'request_argument': 'must be set in message handler method'},
                 ),
+                message,
             )
 
         try:
             request = request_class.load(message)
         except ValidationError as error:
-            return response_from_error(error)
+            return self._response_from_error(error, message)
 
         try:
             return await method(request, user)
         except BaseException as error:  # noqa: BLE001
             return response_from_error(
                 MethodInternalError.from_base_exception(error),
+                request,
             )
@@ -1,23 +1,75 @@
 import logging
-import re
+import os
+import threading
+from collections.abc import Hashable, Iterator
 from typing import Any, Self
-from uuid import uuid4
 
-import orjson
 from pydantic import ValidationError as PydanticValidationError
-
-from smart_rpc.constants import ZERO_TRACE_ID
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from smart_rpc.constants import (
+    ERROR_RESPONSE_CACHE_SIZE,
+    FAILURE_MARK,
+    SUCCESS_MARK,
+    TRACE_ID_POOL_SIZE,
+    ZERO_TRACE_ID,
+)
 from smart_rpc.errors import (
     ExternalError,
     InvalidMessageFormatError,
     ValidationError,
 )
-from smart_rpc.schema import BaseHeadersSchema, BasePayloadSchema
+from smart_rpc.schema import (
+    BaseHeadersSchema,
+    BasePayloadSchema,
+    ErrorPayloadSchema,
+)
 from smart_rpc.utils import compute_average_time
 
 
-class Request:
+class TraceIdPool:
+    size: int
+    trace_ids: Iterator[str]
+    lock: threading.Lock
+
+    def __init__(self, size: int = TRACE_ID_POOL_SIZE) -> None:
+        self.size = size
+        self.reset()
+
+    def _generate(self) -> Iterator[str]:
+        while True:
+            pool = bytearray(os.urandom(16 * self.size))
+
+            for start in range(0, len(pool), 16):
+                pool[start + 6] = pool[start + 6] & 0x0F | 0x40  # version 4
+                pool[start + 8] = pool[start + 8] & 0x3F | 0x80  # RFC 4122 variant
+
+            hex_pool = pool.hex()
+
+            for start in range(0, len(hex_pool), 32):
+                trace_id = hex_pool[start:start + 32]
+                yield f'{trace_id[:8]}-{trace_id[8:12]}-{trace_id[12:16]}-{trace_id[16:20]}-{trace_id[20:]}'
+
+    def reset(self) -> None:
+        self.lock = threading.Lock()
+        self.trace_ids = self._generate()
+
+    def next(self) -> str:
+        with self.lock:
+            return next(self.trace_ids)
+
+
+trace_id_pool = TraceIdPool()
+os.register_at_fork(after_in_child=trace_id_pool.reset)
+
+
+def make_trace_id() -> str:
+    return trace_id_pool.next()
+
+
+class BaseMessage:
     method_name: str
+    _prefix: bytes
     trace_id: str
     payload: BasePayloadSchema
     headers: BaseHeadersSchema
@@ -28,6 +80,48 @@ class Request:
     class HeadersSchema(BaseHeadersSchema):
         ...
 
+    _payload_validator: SchemaValidator = PayloadSchema.__pydantic_validator__  # type:ignore[assignment]
+    _headers_validator: SchemaValidator = HeadersSchema.__pydantic_validator__  # type:ignore[assignment]
+    _payload_serializer: SchemaSerializer = PayloadSchema.__pydantic_serializer__
+    _headers_serializer: SchemaSerializer = HeadersSchema.__pydantic_serializer__
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa:ANN401
+        super().__init_subclass__(**kwargs)
+
+        cls._payload_validator = cls.PayloadSchema.__pydantic_validator__  # type:ignore[assignment]
+        cls._headers_validator = cls.HeadersSchema.__pydantic_validator__  # type:ignore[assignment]
+        cls._payload_serializer = cls.PayloadSchema.__pydantic_serializer__
+        cls._headers_serializer = cls.HeadersSchema.__pydantic_serializer__
+
+    def _validate(
+        self,
+        payload: dict[str, Any] | BasePayloadSchema | None,
+        headers: dict[str, Any] | BaseHeadersSchema | None,
+    ) -> None:
+        if isinstance(headers, BaseHeadersSchema):
+            if headers.trace_id != self.trace_id:
+                headers = headers.model_copy(update={'trace_id': self.trace_id})
+        else:
+            headers = {**headers, 'trace_id': self.trace_id} if headers else {'trace_id': self.trace_id}
+
+        try:
+            self.payload = self._payload_validator.validate_python(payload or {})
+            self.headers = self._headers_validator.validate_python(headers)
+        except PydanticValidationError as error:
+            raise ValidationError.from_base_exception(error) from error
+
+    def dump(self) -> bytes:
+        payload = self._payload_serializer.to_json(self.payload)
+        headers = self._headers_serializer.to_json(self.headers)
+
+        return b''.join((
+            self._prefix,
+            payload,
+            headers,
+        ))
+
+
+class Request(BaseMessage):
     @property
     def headers_schema(self) -> type[BaseHeadersSchema]:
         return BaseHeadersSchema
@@ -36,153 +130,99 @@ class Request:
         self,
         method_name: str,
         trace_id: str | None = None,
-        payload: dict[str, Any] | None = None,
-        headers: dict[str, Any] | None = None,
+        payload: dict[str, Any] | BasePayloadSchema | None = None,
+        headers: dict[str, Any] | BaseHeadersSchema | None = None,
     ) -> None:
-        payload = payload or {}
-        headers = headers or {}
-
         self.method_name = method_name
+        self._prefix = method_name.encode('utf-8')
+        self.trace_id = trace_id or make_trace_id()
 
-        self.trace_id = trace_id or str(uuid4())
-        headers['trace_id'] = self.trace_id
-
-        try:
-            self.payload = self.PayloadSchema.model_validate(payload)
-            self.headers = self.HeadersSchema.model_validate(headers)
-        except PydanticValidationError as error:
-            raise ValidationError.from_base_exception(error) from error
+        self._validate(payload, headers)
 
     @classmethod
-    def load(cls, data: bytes | str) -> Self:
-        message = data if isinstance(data, str) else data.decode('utf-8')
-
-        all_opening_curly_brace = [
-            element.start()
-            for element in re.finditer('(?={)', message)
-        ]
-        if len(all_opening_curly_brace) < 2:  # noqa:PLR2004
-            raise InvalidMessageFormatError
-
-        payload_start_at = all_opening_curly_brace[0]
-        headers_start_at = all_opening_curly_brace[-1]
+    def load(cls, data: bytes | bytearray) -> Self:
+        payload_start_at = data.find(b'{')
+        headers_start_at = data.rfind(b'{')
 
-        if payload_start_at >= headers_start_at:
+        if payload_start_at == -1 or payload_start_at >= headers_start_at:
             raise InvalidMessageFormatError
 
-        method_name = message[0:payload_start_at]
-
         try:
-            payload = orjson.loads(message[payload_start_at:headers_start_at])
-            headers = orjson.loads(message[headers_start_at:])
-        except orjson.JSONDecodeError as error:
+            method_name = data[0:payload_start_at].decode('utf-8')
+            payload = cls._payload_validator.validate_json(data[payload_start_at:headers_start_at])
+            headers = cls._headers_validator.validate_json(data[headers_start_at:])
+        except (UnicodeDecodeError, PydanticValidationError) as error:
             raise ValidationError.from_base_exception(error) from error
 
-        trace_id = headers.get('trace_id', None)
-
         return cls(
             method_name=method_name,
             payload=payload,
             headers=headers,
-            trace_id=trace_id,
+            trace_id=headers.trace_id,
         )
 
-    def dump(self) -> bytes:
-        payload = orjson.dumps(self.PayloadSchema.model_dump(self.payload))
-        headers = orjson.dumps(self.HeadersSchema.model_dump(self.headers))
-
-        return b''.join([
-            self.method_name.encode('utf-8'),
-            payload,
-            headers,
-        ])
-
     @classmethod
-    def find_method_name(cls, data: bytes | str) -> str:
-        message = data if isinstance(data, str) else data.decode('utf-8')
-
-        payload_start_at = message.find('{')
+    def find_method_name(cls, data: bytes | bytearray) -> str:
+        payload_start_at = data.find(b'{')
         if (
             payload_start_at in (-1, 0)
         ):
             raise InvalidMessageFormatError
 
-        return message[0:payload_start_at]
+        try:
+            return data[0:payload_start_at].decode('utf-8')
+        except UnicodeDecodeError as error:
+            raise InvalidMessageFormatError from error
 
     def __str__(self) -> str:
         return f'Request <{self.method_name}: {self.trace_id}>'
 
 
-class Response:
-    method_name: str
-    trace_id: str
-    payload: BasePayloadSchema
-    headers: BaseHeadersSchema
+class Response(BaseMessage):
     success: bool
 
-    class PayloadSchema(BasePayloadSchema):
-        ...
-
-    class HeadersSchema(BaseHeadersSchema):
-        ...
-
     def __init__(
         self,
         method_name: str,
         trace_id: str,
         *,
         success: bool,
-        payload: dict[str, Any] | None = None,
-        headers: dict[str, Any] | None = None,
+        payload: dict[str, Any] | BasePayloadSchema | None = None,
+        headers: dict[str, Any] | BaseHeadersSchema | None = None,
     ) -> None:
         self.method_name = method_name
         self.trace_id = trace_id
         self.success = success
+        self._prefix = method_name.encode('utf-8') + (SUCCESS_MARK if success else FAILURE_MARK)
 
-        payload = payload or {}
-        headers = headers or {}
-        headers['trace_id'] = self.trace_id
-
-        try:
-            self.payload = self.PayloadSchema.model_validate(payload)
-            self.headers = self.HeadersSchema.model_validate(headers)
-        except PydanticValidationError as error:
-            raise ValidationError.from_base_exception(error) from error
+        self._validate(payload, headers)
 
     @classmethod
-    def load(cls, data: bytes | str) -> Self:
-        message = data if isinstance(data, str) else data.decode('utf-8')
-
-        success_start_at = message.find(':')
+    def load(cls, data: bytes) -> Self:
+        success_start_at = data.find(b':')
         if success_start_at < 2:  # noqa:PLR2004
             raise InvalidMessageFormatError
 
-        all_opening_curly_brace = [
-            element.start()
-            for element in re.finditer('(?={)', message)
-        ]
-        if len(all_opening_curly_brace) < 2:  # noqa:PLR2004
-            raise InvalidMessageFormatError
-
-        payload_start_at = all_opening_curly_brace[0]
-        headers_start_at = all_opening_curly_brace[-1]
-
-        if payload_start_at >= headers_start_at:
-            raise InvalidMessageFormatError
+        payload_start_at = data.find(b'{')
+        headers_start_at = data.rfind(b'{')
 
         if (
-            success_start_at >= headers_start_at
+            payload_start_at == -1
+            or success_start_at >= headers_start_at
             or payload_start_at >= headers_start_at
         ):
             raise InvalidMessageFormatError
 
+        try:
+            method_name = data[0:success_start_at].decode('utf-8')
+            payload = cls._payload_validator.validate_json(data[payload_start_at:headers_start_at])
+            headers = cls._headers_validator.validate_json(data[headers_start_at:])
+        except (UnicodeDecodeError, PydanticValidationError) as error:
+            raise ValidationError.from_base_exception(error) from error
 
-        method_name = message[0:success_start_at]
-        success = (message[success_start_at+1:payload_start_at] == 'ok')
-        payload = orjson.loads(message[payload_start_at:headers_start_at])
-        headers = orjson.loads(message[headers_start_at:])
+        success = data[success_start_at+1:payload_start_at] == b'ok'
 
-        if not (trace_id := headers.get('trace_id')):
+        if not (trace_id := headers.trace_id):
             raise InvalidMessageFormatError
 
         return cls(
@@ -193,28 +233,19 @@ class Response:
             headers=headers,
         )
 
-    def dump(self) -> bytes:
-        payload = orjson.dumps(self.PayloadSchema.model_dump(self.payload))
-        headers = orjson.dumps(self.HeadersSchema.model_dump(self.headers))
-        success = b'ok' if self.success else b'err'
-
-        return b''.join([
-            self.method_name.encode('utf-8'),
-            b':',
-            success,
-            payload,
-            headers,
-        ])
-
     def __str__(self) -> str:
         return f'Response[{'ok' if self.success else 'err'}] <{self.method_name}: {self.trace_id}>'
 
 
+class ErrorResponse(Response):
+    PayloadSchema = ErrorPayloadSchema  # type:ignore[assignment]
+
+
 def response_from_error(
     error: ExternalError,
     request: Request | None = None,
 ) -> Response:
-    return Response(
+    return ErrorResponse(
         method_name=(
             request.method_name
             if request
@@ -233,6 +264,25 @@ def response_from_error(
     )
 
 
+error_responses: dict[Hashable, bytes] = {}
+
+
+def dump_error_response(error: ExternalError) -> bytes:
+    try:
+        key = (type(error), error.error_code, error.log_level, frozenset(error.details.items()))
+    except TypeError:  # unhashable details values
+        return response_from_error(error).dump()
+
+    if (data := error_responses.get(key)) is not None:
+        return data
+
+    if len(error_responses) >= ERROR_RESPONSE_CACHE_SIZE:
+        del error_responses[next(iter(error_responses))]
+
+    error_responses[key] = data = response_from_error(error).dump()
+    return data
+
+
 if __name__ == '__main__':
     from rich import print
 
@@ -248,12 +298,12 @@ if __name__ == '__main__':
         return (
             ExampleRequest(
                 method_name='first_method',
-                trace_id=str(uuid4()),
+                trace_id=make_trace_id(),
                 payload=example_request_values,
             ),
             ExampleResponse(
                 method_name='first_method',
-                trace_id=str(uuid4()),
+                trace_id=make_trace_id(),
                 success=True,
                 payload=example_response_values,
             ),
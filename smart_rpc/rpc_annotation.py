@@ -17,16 +17,6 @@ from smart_rpc.examples import example_rpc_annotation
 from smart_rpc.schema import BaseSchema
 from smart_rpc.utils import check_camel_case
 
-FIELD_TYPE_PRIMITIVES = [
-    'int',
-    'float',
-    'boolean',
-    'string',
-    'date',
-    'datetime',
-    'uuid',
-    'null',
-]
 FIELD_TYPE_PRIMITIVES_TO_PYTHON_TYPES = {
     'int': int,
     'float': float,
@@ -37,6 +27,7 @@ FIELD_TYPE_PRIMITIVES_TO_PYTHON_TYPES = {
     'uuid': UUID,
     'null': None,
 }
+FIELD_TYPE_PRIMITIVES = frozenset(FIELD_TYPE_PRIMITIVES_TO_PYTHON_TYPES)
 
 
 type FieldTypePrimitive = (
@@ -57,10 +48,10 @@ type FieldType = FieldTypePrimitive | list[FieldType | list[FieldType]]
 
 
 def field_type_to_python_type(field_type: str) -> type | None:
-    if field_type not in FIELD_TYPE_PRIMITIVES_TO_PYTHON_TYPES:
-        raise AnnotationUnknownFieldTypeError(field_type)
-
-    return FIELD_TYPE_PRIMITIVES_TO_PYTHON_TYPES[field_type]
+    try:
+        return FIELD_TYPE_PRIMITIVES_TO_PYTHON_TYPES[field_type]
+    except KeyError as error:
+        raise AnnotationUnknownFieldTypeError(field_type) from error
 
 
 class AnnotationSchema(BaseSchema):
@@ -83,12 +74,14 @@ class RPCAnnotationDTO:
     enums: dict[str, StrEnum]
     objects: dict[str, dict[str, FieldType]]
     methods: dict[str, RPCAnnotationMethod]
+    field_types: dict[str, FieldType]
 
     def __init__(self, annotation_schema: AnnotationSchema) -> None:
         self.schema = annotation_schema
         self.enums = {}
         self.objects = {}
         self.methods = {}
+        self.field_types = {}
 
         self._make()
 
@@ -109,26 +102,48 @@ class RPCAnnotationDTO:
         self,
         field_value: str | list[str | list[str]],
     ) -> FieldType:
-        if isinstance(field_value, list):
-            return [
-                self._convert_field_value(value) # type:ignore[arg-type]
-                for value in field_value
-            ]
+        if not isinstance(field_value, list):
+            return self._resolve_field_type(field_value)
 
-        if field_value in FIELD_TYPE_PRIMITIVES:
-            return field_type_to_python_type(field_value)
+        resolve_field_type = self._resolve_field_type
+        field_type: list[FieldType | list[FieldType]] = []
+        stack = [(iter(field_value), field_type)]
+
+        while stack:
+            values, converted = stack[-1]
+
+            for value in values:
+                if isinstance(value, list):
+                    nested: list[Any] = []
+                    converted.append(nested)
+                    stack.append((iter(value), nested))
+                    break
+
+                converted.append(resolve_field_type(value))
+            else:
+                stack.pop()
 
-        if field_value in self.enums:
-            return self.enums[field_value]
+        return field_type
 
-        if field_value in self.objects:
-            return self.objects[field_value]
+    def _resolve_field_type(self, field_value: str) -> FieldType:
+        if field_value in self.field_types:
+            return self.field_types[field_value]
 
-        raise AnnotationValidationError(
-            details={
-                'unknown_signature': field_value,
-            },
-        )
+        if field_value in FIELD_TYPE_PRIMITIVES:
+            field_type: FieldType = field_type_to_python_type(field_value)
+        elif field_value in self.enums:
+            field_type = self.enums[field_value]
+        elif field_value in self.objects:
+            field_type = self.objects[field_value]
+        else:
+            raise AnnotationValidationError(
+                details={
+                    'unknown_signature': field_value,
+                },
+            )
+
+        self.field_types[field_value] = field_type
+        return field_type
 
     def _make_objects(self) -> None:
         if not self.schema.objects:
@@ -161,15 +176,12 @@ class RPCAnnotationDTO:
                     },
                 )
 
-            self.methods[method_key] = RPCAnnotationMethod()
-
-            for direction in ['request', 'response']:
-                current_object = (
-                    self.methods[method_key].request
-                    if direction == 'request'
-                    else self.methods[method_key].response
-                )
+            method = self.methods[method_key] = RPCAnnotationMethod()
 
+            for direction, current_object in (
+                ('request', method.request),
+                ('response', method.response),
+            ):
                 for key, value in raw_method[direction].items():
                     current_object[key] = self._convert_field_value(value)
 
@@ -21,3 +21,8 @@ class BasePayloadSchema(BaseSchema):
 
 class BaseHeadersSchema(BaseSchema):
     trace_id: str | None = None
+
+
+class ErrorPayloadSchema(BasePayloadSchema):
+    error_code: str
+    details: dict[str, Any]
@@ -1,6 +1,10 @@
 import asyncio
 import logging
-from typing import Any
+import os
+import signal
+from collections.abc import Callable
+from contextlib import suppress
+from typing import NoReturn
 
 from smart_rpc.constants import MESSAGE_SEPARATOR
 from smart_rpc.errors import (
@@ -13,7 +17,7 @@ from smart_rpc.errors import (
 from smart_rpc.examples import ExampleRequest, ExampleResponse
 from smart_rpc.ifaces import UserIface
 from smart_rpc.message_hander import MessageHandler
-from smart_rpc.messages import Response, response_from_error
+from smart_rpc.messages import Response, dump_error_response
 from smart_rpc.user import User
 from smart_rpc.utils import setup_rich_logging
 
@@ -27,11 +31,12 @@ class Server:
     connection_limit: int
     chunk_size: int
     max_message_size: int
+    workers: int
     log_level: int
     log_messages: bool
 
     server: asyncio.Server
-    users: dict[str, Any]
+    users: dict[int, UserIface]
 
 
     def __init__(
@@ -44,6 +49,7 @@ class Server:
         connection_limit: int = 2 ** 10,  # 1024
         chunk_size: int = 2**15,  # 32 KB
         max_message_size: int = 2**20,  # 1 MB
+        workers: int = 1,
         log_level: int = logging.INFO,
         log_messages: bool = False,
     ) -> None:
@@ -55,6 +61,7 @@ class Server:
         self.connection_limit = connection_limit
         self.chunk_size = chunk_size
         self.max_message_size = max_message_size
+        self.workers = workers
         self.log_level = log_level
         self.log_messages = log_messages
 
@@ -76,51 +83,63 @@ class Server:
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
-    ) -> User:
+    ) -> tuple[int, UserIface]:
         address = writer.get_extra_info('peername')
-        user_address = f'{address[0]}:{address[1]}'
+        fileno = writer.get_extra_info('socket').fileno()
 
-        self.users[user_address] = self.user_class(
-            address=user_address,
+        user = self.user_class(
+            address=f'{address[0]}:{address[1]}',
             reader=reader,
             writer=writer,
         )
+        self.users[fileno] = user
 
-        return self.users[user_address]
+        return fileno, user
+
+    async def _user_disconnected(self, fileno: int, user: UserIface) -> None:
+        if self.users.get(fileno) is not user:
+            return
 
-    async def _user_disconnected(self, user: User) -> None:
         self.logger.debug(f'User {user.address} was disconnected')
 
+        del self.users[fileno]
+
         user.writer.close()
         await user.writer.wait_closed()
 
-        self.users.pop(user.address)
-
-    async def _send_response(self, user: User, response: Response) -> None:
-        if user.address not in self.users:
+    async def _send(self, user: UserIface, data: tuple[bytes, ...]) -> None:
+        if user.writer.is_closing():
             return
 
         try:
-            user.writer.write(response.dump() + MESSAGE_SEPARATOR)
+            user.writer.writelines(data)
             await user.writer.drain()
-        except BrokenPipeError:
-            await self._user_disconnected(user)
-            return
+        except ConnectionError:
+            user.writer.close()
 
-    async def _send_error(self, user: User, error: ExternalError) -> None:
-        return await self._send_response(
+    async def _send_response(self, user: UserIface, response: Response) -> None:
+        return await self._send(
             user=user,
-            response=response_from_error(error),
+            data=(response.dump(), MESSAGE_SEPARATOR),
         )
 
-    async def _process_connection(
+    async def _send_error(
         self,
-        user: User,
+        user: UserIface,
+        error: ExternalError,
     ) -> None:
-        data = await user.reader.readuntil(MESSAGE_SEPARATOR)
+        return await self._send(
+            user=user,
+            data=(dump_error_response(error), MESSAGE_SEPARATOR),
+        )
 
+    async def _process_message(
+        self,
+        user: UserIface,
+        message: bytes | bytearray,
+    ) -> None:
         response = await self.message_handler.handle(
-            message=data[0:-1],
+            message=message,
             user=user,
         )
 
@@ -133,40 +152,74 @@ class Server:
             response=response,
         )
 
+    def _check_message_size(self, message_size: int) -> None:
+        if message_size > self.max_message_size:
+            raise asyncio.LimitOverrunError(
+                message='Message exceed the limit',
+                consumed=message_size,
+            )
+
+    async def _process_connection(
+        self,
+        user: UserIface,
+    ) -> None:
+        buffer = bytearray()
+
+        while True:
+            chunk = await user.reader.read(self.chunk_size)
+            if not chunk:
+                raise asyncio.IncompleteReadError(bytes(buffer), None)
+
+            scan_from = len(buffer)
+            buffer += chunk
+            message_start_at = 0
+
+            while (message_end_at := buffer.find(MESSAGE_SEPARATOR, scan_from)) != -1:
+                self._check_message_size(message_end_at - message_start_at)
+
+                await self._process_message(
+                    user=user,
+                    message=buffer[message_start_at:message_end_at],
+                )
+                if user.writer.is_closing():
+                    return
+
+                message_start_at = scan_from = message_end_at + 1
+
+            if message_start_at:
+                del buffer[:message_start_at]
+
+            self._check_message_size(len(buffer))
+
     async def _handle_connection(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
     ) -> None:
-        user = self._make_user(
+        fileno, user = self._make_user(
             reader=reader,
             writer=writer,
         )
 
         self.logger.debug(f'Connected user {user.address}')
 
-        while True:
-            try:
-                await self._process_connection(user)
+        try:
+            await self._process_connection(user)
 
-            except (
-                ConnectionError,
-                asyncio.IncompleteReadError,
-            ):
-                await self._user_disconnected(user)
+        except (
+            ConnectionError,
+            asyncio.IncompleteReadError,
+        ):
+            pass
 
-            except asyncio.LimitOverrunError:
-                self.logger.debug(f'User {user.address} reach max message size')
-                await self._send_error(
-                    user=user,
-                    error=MaxMessageSizeReceivedError(
-                        max_message_size=self.max_message_size,
-                    ),
-                )
-                await self._user_disconnected(user)
+        except asyncio.LimitOverrunError:
+            self.logger.debug(f'User {user.address} reach max message size')
+            await self._send_error(
+                user,
+                MaxMessageSizeReceivedError(self.max_message_size),
+            )
 
-            else:
-                break
+        await self._user_disconnected(fileno, user)
 
     async def _connect(self) -> None:
         self.logger.info(f'Starting server on {self.host}:{self.port}')
@@ -176,27 +229,93 @@ class Server:
             client_connected_cb=self._handle_connection,
             host=self.host,
             port=self.port,
-            limit=self.max_message_size,
+            limit=self.chunk_size * 2,
+            reuse_port=self.workers > 1,
         )
 
     async def _run(self) -> None:
         await self._connect()
 
         async with self.server as server:
-            await server.serve_forever()
+            try:
+                await server.serve_forever()
+            finally:
+                for user in list(self.users.values()):
+                    user.writer.close()
 
     async def run(self) -> None:
         try:
             await self._run()
+        except asyncio.CancelledError:
+            self.logger.info('Exiting')
         except (
             OSError,
             KeyboardInterrupt,
             ServerFatalError,
-            asyncio.CancelledError,
         ):
             self.logger.exception('Fatal error')
             self.logger.info('Exiting')
 
+    def _fork_workers(self) -> list[int]:
+        worker_pids = []
+
+        for _ in range(self.workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                return []
+
+            worker_pids.append(pid)
+
+        return worker_pids
+
+    def _stop_workers(self, worker_pids: list[int]) -> None:
+        for pid in worker_pids:
+            os.kill(pid, signal.SIGTERM)
+
+        for pid in worker_pids:
+            _, status = os.waitpid(pid, 0)
+
+            if exit_code := os.waitstatus_to_exitcode(status):
+                self.logger.error(f'Worker {pid} exited with status {exit_code}')
+
+    async def _serve(self) -> None:
+        task = asyncio.ensure_future(self._run())
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            self.logger.info('Exiting')
+
+    def _serve_worker(
+        self,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None,
+    ) -> NoReturn:
+        try:
+            with suppress(KeyboardInterrupt):
+                asyncio.run(self._serve(), loop_factory=loop_factory)
+        except BaseException:
+            self.logger.exception(f'Worker {os.getpid()} crashed')
+            os._exit(1)
+
+        os._exit(0)
+
+    def serve(
+        self,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
+    ) -> None:
+        main_pid = os.getpid()
+        worker_pids = self._fork_workers()
+
+        if os.getpid() != main_pid:
+            self._serve_worker(loop_factory)
+
+        try:
+            with suppress(KeyboardInterrupt):
+                asyncio.run(self._serve(), loop_factory=loop_factory)
+        finally:
+            self._stop_workers(worker_pids)
+
 
 if __name__ == '__main__':
     setup_rich_logging()
@@ -214,10 +333,8 @@ if __name__ == '__main__':
             trace_id=request.trace_id,
             payload={
                 'some_param': user.address,
-                **request.payload.model_dump(),
-            },
-            headers={
-                'trace_id': request.trace_id,
+                'send_this': request.payload.send_this,
+                'object_field': request.payload.object_field,
             },
         )
 
@@ -229,4 +346,4 @@ if __name__ == '__main__':
         message_handler=handler,
     )
 
-    asyncio.run(srv.run())
+    srv.serve()
@@ -1,7 +1,12 @@
+import inspect
 import logging
 import re
-from datetime import UTC, datetime
-from functools import wraps
+import time
+from functools import (
+    lru_cache,
+    partialmethod,
+    wraps,
+)
 from typing import Any
 
 from rich import print
@@ -10,10 +15,12 @@ from rich.logging import RichHandler
 from smart_rpc.types import SyncFunction
 
 AVERAGE_TEST_COUNT = 10
+CAMEL_CASE_PATTERN = re.compile('^([A-Z][a-z]+)+$')
 
 
+@lru_cache(maxsize=4096)
 def check_camel_case(validated: str) -> bool:
-    return bool(re.match('^([A-Z][a-z]+)+$', validated))
+    return bool(CAMEL_CASE_PATTERN.match(validated))
 
 
 def time_it(
@@ -24,12 +31,9 @@ def time_it(
         *args: list[Any],
         **kwargs: dict[str, Any],
     ) -> Any:  # noqa:ANN401
-        started_at = datetime.now(tz=UTC)
+        started_at = time.perf_counter_ns()
         result = function(*args, **kwargs)
-        finished_at = datetime.now(tz=UTC)
-
-        raw_duration = finished_at - started_at
-        duration = float(raw_duration.seconds + raw_duration.microseconds / 1000)
+        duration = (time.perf_counter_ns() - started_at) / 1e9
 
         print(
             f'[ocean_blue4][TIME][/ocean_blue4] Function [turquoise4][bold]{function.__name__}[/bold][/turquoise4]'
@@ -48,19 +52,14 @@ def compute_average_time(
         *args: list[Any],
         **kwargs: dict[str, Any],
     ) -> Any:  # noqa:ANN401
-        started_at = datetime.now(tz=UTC)
         result = None
+        started_at = time.perf_counter_ns()
 
         for _ in range(AVERAGE_TEST_COUNT):
             result = function(*args, **kwargs)
 
-        finished_at = datetime.now(tz=UTC)
-
-        raw_duration = finished_at - started_at
-        duration = float(raw_duration.seconds + raw_duration.microseconds / 1000)
-
-        raw_average_duration = raw_duration / AVERAGE_TEST_COUNT
-        average_duration = float(raw_average_duration.seconds + raw_average_duration.microseconds / 1000)
+        duration = (time.perf_counter_ns() - started_at) / 1e9
+        average_duration = duration / AVERAGE_TEST_COUNT
 
         print(
             f'[steel_blue1][TIME][/steel_blue1] Function [turquoise4][bold]{function.__name__}[/bold][/turquoise4]:\n'
@@ -72,12 +71,15 @@ def compute_average_time(
     return wrapper
 
 
+def is_method(attribute: object) -> bool:
+    return callable(attribute) or isinstance(attribute, classmethod | staticmethod | partialmethod)
+
+
 def get_class_methods(cls: object) -> list[str]:
     return [
         attribute
-        for attribute in dir(cls)
-        if callable(getattr(cls, attribute))
-        and attribute.startswith('_') is False
+        for attribute, _ in inspect.getmembers_static(cls, is_method)
+        if attribute.startswith('_') is False
     ]
 
 
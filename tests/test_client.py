@@ -0,0 +1,258 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from smart_rpc.client import BaseClient
+from smart_rpc.constants import MESSAGE_SEPARATOR
+from smart_rpc.errors import ClientFatalError, ValidationError
+from smart_rpc.examples import (
+    ExampleRequest,
+    ExampleResponse,
+    example_request_values,
+    example_response_values,
+)
+from smart_rpc.message_hander import MessageHandler
+from smart_rpc.messages import ErrorResponse
+
+type ConnectionCallback = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+def make_request(trace_id: str | None = None) -> ExampleRequest:
+    return ExampleRequest(
+        method_name='first_method',
+        trace_id=trace_id,
+        payload=example_request_values,
+    )
+
+
+async def connect_client(
+    callback: ConnectionCallback,
+    **kwargs: int,
+) -> tuple[BaseClient, asyncio.Server]:
+    server = await asyncio.start_server(callback, host='127.0.0.1', port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    client = BaseClient(host='127.0.0.1', port=port, **kwargs)
+    await client.connect()
+
+    return client, server
+
+
+async def assert_fails_fast(client: BaseClient) -> None:
+    with pytest.raises(ClientFatalError):
+        await asyncio.wait_for(client.send(make_request()), timeout=1)
+
+
+def test_send_fails_fast_after_server_closed() -> None:
+    async def close_connection(_: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.close()
+
+    async def main() -> None:
+        client, server = await connect_client(close_connection, timeout_ms=5000)
+        await client.reader_task
+
+        assert client.connection_error is not None
+        assert client.writer.is_closing()
+        await assert_fails_fast(client)
+
+        server.close()
+
+    asyncio.run(main())
+
+
+def test_pending_and_later_sends_fail_after_oversize_response() -> None:
+    async def send_oversize(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(MESSAGE_SEPARATOR)
+        writer.write(b'x' * 2048)
+        await writer.drain()
+
+    async def main() -> None:
+        client, server = await connect_client(send_oversize, max_message_size=1024, timeout_ms=5000)
+
+        await assert_fails_fast(client)
+        await assert_fails_fast(client)
+        assert not client.pending
+
+        server.close()
+
+    asyncio.run(main())
+
+
+def test_duplicate_in_flight_trace_id_is_rejected() -> None:
+    async def echo_delayed(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        data = await reader.readuntil(MESSAGE_SEPARATOR)
+        request = ExampleRequest.load(data[:-1])
+        await asyncio.sleep(0.05)
+
+        response = ExampleResponse(
+            method_name=request.method_name,
+            trace_id=request.trace_id,
+            success=True,
+            payload=example_response_values,
+        )
+        writer.writelines((response.dump(), MESSAGE_SEPARATOR))
+        await writer.drain()
+
+    async def main() -> None:
+        client, server = await connect_client(echo_delayed)
+
+        first = asyncio.create_task(client.send(make_request('same')))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ValidationError):
+            await client.send(make_request('same'))
+
+        response = await first
+        assert response.success
+        assert response.trace_id == 'same'
+
+        server.close()
+
+    asyncio.run(main())
+
+
+def make_response(request: ExampleRequest) -> ExampleResponse:
+    return ExampleResponse(
+        method_name=request.method_name,
+        trace_id=request.trace_id,
+        success=True,
+        payload=example_response_values,
+    )
+
+
+def test_out_of_order_responses_resolve_matching_requests() -> None:
+    count = 10
+
+    async def reply_in_reverse(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        requests = [
+            ExampleRequest.load((await reader.readuntil(MESSAGE_SEPARATOR))[:-1])
+            for _ in range(count)
+        ]
+
+        for request in reversed(requests):
+            writer.writelines((make_response(request).dump(), MESSAGE_SEPARATOR))
+
+        await writer.drain()
+
+    async def main() -> None:
+        client, server = await connect_client(reply_in_reverse)
+        requests = [make_request() for _ in range(count)]
+
+        responses = await asyncio.gather(*(client.send(request) for request in requests))
+
+        assert [response.trace_id for response in responses] == [request.trace_id for request in requests]
+        assert all(response.success for response in responses)
+
+        await client.close()
+        server.close()
+
+    asyncio.run(main())
+
+
+def test_error_response_echoes_request_trace_id() -> None:
+    handler = MessageHandler()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        data = await reader.readuntil(MESSAGE_SEPARATOR)
+        response = await handler.handle(data[:-1], None)  # type:ignore[arg-type]
+
+        writer.writelines((response.dump(), MESSAGE_SEPARATOR))
+        await writer.drain()
+
+    async def main() -> None:
+        client, server = await connect_client(handle)
+        request = make_request()
+
+        response = await client.send(request)
+
+        assert not response.success
+        assert response.trace_id == request.trace_id
+        assert isinstance(response, ErrorResponse)
+        assert response.payload.error_code == 'UnknownMethod'  # type:ignore[attr-defined]
+        assert response.payload.details == {'method': 'first_method'}  # type:ignore[attr-defined]
+
+        await client.close()
+        server.close()
+
+    asyncio.run(main())
+
+
+def test_close_stops_reader_and_fails_pending() -> None:
+    async def never_reply(reader: asyncio.StreamReader, _: asyncio.StreamWriter) -> None:
+        await reader.read()
+
+    async def main() -> None:
+        client, server = await connect_client(never_reply, timeout_ms=5000)
+
+        pending = asyncio.create_task(client.send(make_request()))
+        await asyncio.sleep(0.01)
+        await client.close()
+
+        assert client.reader_task.done()
+        assert client.writer.is_closing()
+        assert not client.pending
+
+        await assert_fails_fast(client)
+        with pytest.raises(ClientFatalError):
+            await asyncio.wait_for(pending, timeout=1)
+
+        server.close()
+
+    asyncio.run(main())
+
+
+def test_async_context_closes_client() -> None:
+    async def never_reply(reader: asyncio.StreamReader, _: asyncio.StreamWriter) -> None:
+        await reader.read()
+
+    async def main() -> None:
+        server = await asyncio.start_server(never_reply, host='127.0.0.1', port=0)
+        port = server.sockets[0].getsockname()[1]
+
+        async with BaseClient(host='127.0.0.1', port=port) as client:
+            assert not client.reader_task.done()
+
+        assert client.reader_task.done()
+        assert client.writer.is_closing()
+
+        server.close()
+
+    asyncio.run(main())
+
+
+def test_concurrent_sends_are_written_and_drained_once() -> None:
+    count = 10
+
+    async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        for _ in range(count):
+            request = ExampleRequest.load((await reader.readuntil(MESSAGE_SEPARATOR))[:-1])
+            writer.writelines((make_response(request).dump(), MESSAGE_SEPARATOR))
+
+        await writer.drain()
+
+    async def main() -> None:
+        client, server = await connect_client(echo)
+        calls: list[str] = []
+        writelines, drain = client.writer.writelines, client.writer.drain
+
+        def spy_writelines(data: list[bytes]) -> None:
+            calls.append(f'writelines:{len(data)}')
+            writelines(data)
+
+        async def spy_drain() -> None:
+            calls.append('drain')
+            await drain()
+
+        client.writer.writelines = spy_writelines  # type:ignore[method-assign,assignment]
+        client.writer.drain = spy_drain  # type:ignore[method-assign]
+
+        responses = await asyncio.gather(*(client.send(make_request()) for _ in range(count)))
+
+        assert len(responses) == count
+        assert calls == [f'writelines:{count * 2}', 'drain']
+
+        await client.close()
+        server.close()
+
+    asyncio.run(main())
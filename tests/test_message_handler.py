@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from smart_rpc.examples import (
+    ExampleRequest,
+    ExampleResponse,
+    example_request_values,
+    example_response_values,
+)
+from smart_rpc.message_hander import MessageHandler
+
+
+async def first_method(request: ExampleRequest, _: object) -> ExampleResponse:
+    return ExampleResponse(
+        method_name=request.method_name,
+        trace_id=request.trace_id,
+        success=True,
+        payload=example_response_values,
+    )
+
+
+def test_methods_are_derived_from_routes() -> None:
+    handler = MessageHandler()
+    handler.add_method('first_method', first_method)  # type:ignore[arg-type]
+
+    included = MessageHandler()
+    included.include(handler)
+
+    assert dict(included.methods) == {'first_method': first_method}
+    assert included.routes['first_method'] == (first_method, ExampleRequest)
+
+    with pytest.raises(TypeError):
+        included.methods['other_method'] = first_method  # type:ignore[index]
+
+
+def test_handle_dispatches_through_routes() -> None:
+    handler = MessageHandler()
+    handler.add_method('first_method', first_method)  # type:ignore[arg-type]
+    request = ExampleRequest(method_name='first_method', payload=example_request_values)
+
+    response = asyncio.run(handler.handle(request.dump(), None))  # type:ignore[arg-type]
+
+    assert response.success
+    assert response.trace_id == request.trace_id
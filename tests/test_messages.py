@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from smart_rpc.errors import MaxMessageSizeReceivedError, MethodInternalError
+from smart_rpc.messages import (
+    ErrorResponse,
+    Request,
+    Response,
+    TraceIdPool,
+    dump_error_response,
+    error_responses,
+)
+
+
+def test_trace_ids_are_uuid4() -> None:
+    pool = TraceIdPool(size=4)
+
+    for _ in range(10):
+        trace_id = UUID(pool.next())
+        assert trace_id.version == 4  # noqa:PLR2004
+
+
+def test_trace_id_pool_is_thread_safe() -> None:
+    pool = TraceIdPool(size=16)
+
+    def take_trace_ids(_: int) -> list[str]:
+        return [pool.next() for _ in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        batches = list(executor.map(take_trace_ids, range(8)))
+
+    trace_ids = [trace_id for batch in batches for trace_id in batch]
+    assert len(set(trace_ids)) == len(trace_ids)
+
+
+def test_request_does_not_mutate_shared_headers() -> None:
+    headers = Request.HeadersSchema()
+
+    first = Request('method', headers=headers)
+    second = Request('method', headers=headers)
+
+    assert headers.trace_id is None
+    assert first.headers.trace_id == first.trace_id
+    assert second.headers.trace_id == second.trace_id
+    assert Request.load(first.dump()).trace_id == first.trace_id
+
+
+def test_response_does_not_mutate_shared_headers() -> None:
+    headers = Response.HeadersSchema()
+
+    first = Response('method', 'first', success=True, headers=headers)
+    second = Response('method', 'second', success=True, headers=headers)
+
+    assert headers.trace_id is None
+    assert Response.load(first.dump()).trace_id == 'first'
+    assert Response.load(second.dump()).trace_id == 'second'
+
+
+def test_error_responses_are_cached_by_value() -> None:
+    error_responses.clear()
+
+    first = dump_error_response(MaxMessageSizeReceivedError(1024))
+    second = dump_error_response(MaxMessageSizeReceivedError(1024))
+    other = dump_error_response(MaxMessageSizeReceivedError(2048))
+
+    assert first is second
+    assert first != other
+    assert len(error_responses) == 2  # noqa:PLR2004
+
+    response = ErrorResponse.load(other)
+    assert response.payload.error_code == 'MaxMessageSizeReceived'  # type:ignore[attr-defined]
+    assert response.payload.details == {'max_message_size': 2048}  # type:ignore[attr-defined]
+
+
+def test_error_response_with_unhashable_details_is_not_cached() -> None:
+    error_responses.clear()
+
+    data = dump_error_response(MethodInternalError({'errors': ['first', 'second']}))
+
+    assert not error_responses
+    assert ErrorResponse.load(data).payload.details == {'errors': ['first', 'second']}  # type:ignore[attr-defined]
@@ -0,0 +1,402 @@
+import asyncio
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+
+import pytest
+
+from smart_rpc.constants import MESSAGE_SEPARATOR
+from smart_rpc.examples import (
+    ExampleRequest,
+    ExampleResponse,
+    example_request_values,
+)
+from smart_rpc.ifaces import UserIface
+from smart_rpc.message_hander import MessageHandler
+from smart_rpc.messages import ErrorResponse, Response
+from smart_rpc.server import Server
+from smart_rpc.user import User
+
+handler = MessageHandler()
+
+
+@handler.method('first_method')  # type:ignore[arg-type]
+async def first_method(
+    request: ExampleRequest,
+    user: User,
+) -> ExampleResponse:
+    return ExampleResponse(
+        method_name=request.method_name,
+        success=True,
+        trace_id=request.trace_id,
+        payload={
+            'some_param': user.address,
+            'send_this': request.payload.send_this,
+            'object_field': request.payload.object_field,
+        },
+    )
+
+
+@handler.method('pid_method')  # type:ignore[arg-type]
+async def pid_method(
+    request: ExampleRequest,
+    _: User,
+) -> ExampleResponse:
+    return ExampleResponse(
+        method_name=request.method_name,
+        success=True,
+        trace_id=request.trace_id,
+        payload={
+            'some_param': str(os.getpid()),
+            'send_this': request.payload.send_this,
+            'object_field': request.payload.object_field,
+        },
+    )
+
+
+closing_calls: list[str] = []
+
+
+@handler.method('closing_method')  # type:ignore[arg-type]
+async def closing_method(
+    request: ExampleRequest,
+    user: User,
+) -> ExampleResponse:
+    closing_calls.append(request.trace_id)
+    user.writer.close()
+
+    return ExampleResponse(
+        method_name=request.method_name,
+        success=True,
+        trace_id=request.trace_id,
+    )
+
+
+type Connect = Callable[[], Awaitable[tuple[asyncio.StreamReader, asyncio.StreamWriter]]]
+
+
+@asynccontextmanager
+async def running_server(**kwargs: int | type[UserIface]) -> AsyncIterator[tuple[Server, Connect]]:
+    server = Server(
+        host='127.0.0.1',
+        port=0,
+        message_handler=handler,
+        log_level=logging.CRITICAL,
+        **kwargs,  # type:ignore[arg-type]
+    )
+    await server._connect()
+    port = server.server.sockets[0].getsockname()[1]
+
+    async def connect() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection('127.0.0.1', port)
+
+    try:
+        yield server, connect
+    finally:
+        server.server.close()
+
+
+async def wait_for_users(server: Server, count: int) -> None:
+    for _ in range(500):
+        if len(server.users) == count:
+            return
+
+        await asyncio.sleep(0.01)
+
+    assert len(server.users) == count
+
+
+def make_frame(
+    send_this: str = 'back',
+    method_name: str = 'first_method',
+) -> tuple[ExampleRequest, bytes]:
+    request = ExampleRequest(
+        method_name=method_name,
+        payload={**example_request_values, 'send_this': send_this},
+    )
+
+    return request, request.dump() + MESSAGE_SEPARATOR
+
+
+async def read_response(
+    reader: asyncio.StreamReader,
+    response_class: type[Response] = Response,
+) -> Response:
+    data = await asyncio.wait_for(reader.readuntil(MESSAGE_SEPARATOR), timeout=5)
+    return response_class.load(data[:-1])
+
+
+async def assert_rejected_as_oversize(reader: asyncio.StreamReader) -> None:
+    response = await read_response(reader, ErrorResponse)
+
+    assert not response.success
+    assert response.payload.error_code == 'MaxMessageSizeReceived'  # type:ignore[attr-defined]
+    assert await asyncio.wait_for(reader.read(), timeout=5) == b''
+
+
+def test_multiple_frames_in_one_chunk() -> None:
+    async def main() -> None:
+        async with running_server() as (_, connect):
+            reader, writer = await connect()
+            requests, frames = zip(*(make_frame(str(i)) for i in range(5)), strict=True)
+
+            writer.write(b''.join(frames))
+            await writer.drain()
+
+            for request in requests:
+                response = await read_response(reader)
+                assert response.success
+                assert response.trace_id == request.trace_id
+
+            writer.close()
+
+    asyncio.run(main())
+
+
+def test_frame_split_across_chunks() -> None:
+    async def main() -> None:
+        async with running_server(chunk_size=16) as (_, connect):
+            reader, writer = await connect()
+            request, frame = make_frame()
+
+            for start in range(0, len(frame), 7):
+                writer.write(frame[start:start + 7])
+                await writer.drain()
+                await asyncio.sleep(0)
+
+            response = await read_response(reader)
+            assert response.success
+            assert response.trace_id == request.trace_id
+
+            writer.close()
+
+    asyncio.run(main())
+
+
+def test_complete_oversize_frame_is_rejected() -> None:
+    async def main() -> None:
+        async with running_server(max_message_size=2000) as (server, connect):
+            reader, writer = await connect()
+            _, frame = make_frame('x' * 5000)
+
+            writer.write(frame)
+            await writer.drain()
+
+            await assert_rejected_as_oversize(reader)
+            assert not server.users
+
+    asyncio.run(main())
+
+
+def test_oversize_frame_without_separator_is_rejected() -> None:
+    async def main() -> None:
+        async with running_server(max_message_size=2000, chunk_size=512) as (_, connect):
+            reader, writer = await connect()
+
+            writer.write(b'x' * 5000)
+            await writer.drain()
+
+            await assert_rejected_as_oversize(reader)
+
+    asyncio.run(main())
+
+
+def test_frames_after_failed_write_are_not_dispatched() -> None:
+    async def main() -> None:
+        async with running_server() as (server, connect):
+            reader, writer = await connect()
+            frames = [make_frame(method_name='closing_method')[1] for _ in range(3)]
+
+            writer.write(b''.join(frames))
+            await writer.drain()
+
+            assert await asyncio.wait_for(reader.read(), timeout=5) == b''
+            await wait_for_users(server, 0)
+            assert len(closing_calls) == 1
+
+    asyncio.run(main())
+
+
+def test_stale_disconnect_keeps_user_with_reused_fileno() -> None:
+    async def main() -> None:
+        async with running_server() as (server, connect):
+            _, first_writer = await connect()
+            await wait_for_users(server, 1)
+            [(first_fileno, first_user)] = server.users.items()
+
+            first_writer.close()
+            await wait_for_users(server, 0)
+
+            _, second_writer = await connect()
+            await wait_for_users(server, 1)
+            [second_user] = server.users.values()
+
+            await server._user_disconnected(first_fileno, first_user)
+            assert list(server.users.values()) == [second_user]
+
+            second_writer.close()
+
+    asyncio.run(main())
+
+
+class MinimalUser(UserIface):
+    def __init__(
+        self,
+        address: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.address = address
+        self.reader = reader
+        self.writer = writer
+
+
+def test_custom_user_class_without_fileno() -> None:
+    async def main() -> None:
+        async with running_server(user_class=MinimalUser) as (server, connect):
+            reader, writer = await connect()
+            request, frame = make_frame()
+
+            writer.write(frame)
+            await writer.drain()
+
+            response = await read_response(reader)
+            assert response.trace_id == request.trace_id
+            assert isinstance(next(iter(server.users.values())), MinimalUser)
+
+            writer.close()
+            await wait_for_users(server, 0)
+
+    asyncio.run(main())
+
+
+SERVE_SCRIPT = '''
+import asyncio
+import logging
+import os
+import sys
+
+from smart_rpc.server import Server
+from tests.test_server import handler
+
+main_pid = os.getpid()
+
+
+class CrashingWorkersServer(Server):
+    async def _run(self) -> None:
+        if os.getpid() != main_pid:
+            raise RuntimeError('worker failed')
+
+        await super()._run()
+
+
+logging.basicConfig(level=logging.INFO)
+server_class = CrashingWorkersServer if sys.argv[2] == 'crash' else Server
+server_class(
+    host='127.0.0.1',
+    port=int(sys.argv[1]),
+    message_handler=handler,
+    workers=3,
+).serve()
+'''
+
+
+def start_workers(mode: str, log_path: Path) -> tuple[subprocess.Popen[bytes], int]:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    with log_path.open('wb') as log:
+        process = subprocess.Popen(  # noqa:S603
+            [sys.executable, '-c', SERVE_SCRIPT, str(port), mode],
+            cwd=Path(__file__).parent.parent,
+            stderr=log,
+        )
+
+    return process, port
+
+
+async def request_worker_pid(port: int) -> int:
+    for _ in range(500):
+        with suppress(ConnectionRefusedError):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            break
+
+        await asyncio.sleep(0.01)
+    else:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+    writer.write(make_frame(method_name='pid_method')[1])
+    response = await read_response(reader, ExampleResponse)
+    writer.close()
+
+    return int(response.payload.some_param)  # type:ignore[attr-defined]
+
+
+def stop_workers(process: subprocess.Popen[bytes], log_path: Path) -> str:
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=10)
+
+    return log_path.read_text()
+
+
+def test_serve_with_workers_exits_cleanly_on_sigterm(tmp_path: Path) -> None:
+    log_path = tmp_path / 'server.log'
+    process, port = start_workers('serve', log_path)
+
+    async def main() -> set[int]:
+        pids: set[int] = set()
+
+        for _ in range(200):
+            pids.add(await request_worker_pid(port))
+            if len(pids) == 3:  # noqa:PLR2004
+                break
+
+        return pids
+
+    try:
+        pids = asyncio.run(main())
+    finally:
+        log = stop_workers(process, log_path)
+
+    assert process.pid in pids
+    assert len(pids) == 3  # noqa:PLR2004
+    assert process.returncode == 0
+    assert 'Fatal error' not in log
+    assert 'Traceback' not in log
+    assert 'exited with status' not in log
+
+    for pid in pids - {process.pid}:
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+def test_serve_reports_crashed_workers(tmp_path: Path) -> None:
+    log_path = tmp_path / 'server.log'
+    process, port = start_workers('crash', log_path)
+
+    try:
+        assert asyncio.run(request_worker_pid(port)) == process.pid
+
+        for _ in range(500):
+            if log_path.read_text().count('RuntimeError: worker failed') == 2:  # noqa:PLR2004
+                break
+
+            time.sleep(0.01)
+    finally:
+        log = stop_workers(process, log_path)
+
+    assert process.returncode == 0
+    assert log.count('RuntimeError: worker failed') == 2  # noqa:PLR2004
+    assert log.count('exited with status 1') == 2  # noqa:PLR2004
@@ -0,0 +1,37 @@
+from functools import partialmethod
+from typing import Any
+
+from smart_rpc.utils import get_class_methods
+
+
+class Sample:
+    value = 1
+
+    def method(self, argument: int = 0) -> int:
+        return argument
+
+    @classmethod
+    def class_method(cls) -> None:
+        ...
+
+    @staticmethod
+    def static_method() -> None:
+        ...
+
+    partial = partialmethod(method, 1)
+
+    @property
+    def callable_property(self) -> Any:  # noqa:ANN401
+        return self.method
+
+    def _private(self) -> None:
+        ...
+
+
+def test_get_class_methods() -> None:
+    assert get_class_methods(Sample) == [
+        'class_method',
+        'method',
+        'partial',
+        'static_method',
+    ]